@@ -32,6 +32,11 @@ from celery.task.control import discard_all
 from evolve import CONF_DIR, POPSIZE, MAXGENS
 from evolve import individual_paths, stats_path
 
+try:
+    input = raw_input  # Python 2
+except NameError:
+    pass
+
 ##########################################################################
 ## Command Line Variables
 ##########################################################################
@@ -58,14 +63,14 @@ def reset(args):
 
     def confirm(prompt="Continue? [y/n] "):
         valid = {'yes': True, 'y': True, 'no': False, 'n':False}
-        choice = raw_input(prompt).lower()
+        choice = input(prompt).lower()
         if choice in valid:
             return valid[choice]
         return confirm(prompt)
 
     if not args.force:
-        print "Resetting will permanently remove population and Queue!"
-        print "Removing from: %s" % args.dirname
+        print("Resetting will permanently remove population and Queue!")
+        print("Removing from: %s" % args.dirname)
         if not confirm():
             return "Exiting without deleting anything."
 
@@ -77,7 +82,7 @@ def reset(args):
                 os.remove(path)
                 files += 1
         except Exception as e:
-            print "Error removing %s: %s" % (path, str(e))
+            print("Error removing %s: %s" % (path, str(e)))
 
     queue = discard_all()
 
@@ -98,19 +103,19 @@ def run(args):
         return "Population has not been initialized!"
 
     started = time.time()
-    print started
+    print(started)
     sys.stdout.flush()
 
     try:
         evolver.run()
     except Exception as e:
         finished = time.time()
-        print finished
+        print(finished)
         sys.stdout.flush()
         return str(e)
 
     finished = time.time()
-    print finished
+    print(finished)
     sys.stdout.flush()
 
     return "%s seconds to evolve %i generations" % ((finished - started), args.maxgens)
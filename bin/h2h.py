@@ -54,7 +54,7 @@ def queue_evaluation(args):
     else:
         os.makedirs(outdir)
 
-    for idx in xrange(1, args.trials+1):
+    for idx in range(1, args.trials+1):
         outpath = os.path.join(outdir, '%s_%02i.csv' % (args.prefix, idx))
         head2head.delay(config, outpath, args.iterations)
 
@@ -78,7 +78,7 @@ def consolidate(args):
 
         with open(path, 'r') as data:
             reader = csv.reader(data)
-            reader.next() # Skip the first line
+            next(reader) # Skip the first line
             for idx, row in enumerate(reader):
                 if len(results) == idx:
                     results.append(list(float(v) for v in row))
@@ -98,7 +98,7 @@ def consolidate(args):
         try:
             import matplotlib.pyplot as plt
         except ImportError:
-            print "matplotlib is required to graph results"
+            print("matplotlib is required to graph results")
 
         fig, axe = plt.subplots(figsize=(10,7))
 
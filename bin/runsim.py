@@ -66,14 +66,14 @@ def simulate(args):
     start = time.time()
     world = World(ally_conf_path=args.conf_path)
 
-    print "Starting headless simulation, use CTRL+C to quit."
+    print("Starting headless simulation, use CTRL+C to quit.")
     while world.time < world.iterations:
         try:
             world.update()
             if world.time % 1000 == 0:
-                print "%ik iterations completed" % (world.time / 1000)
+                print("%ik iterations completed" % (world.time // 1000))
         except KeyboardInterrupt:
-            print "Quitting Early!"
+            print("Quitting Early!")
             break
 
     finit = time.time()
@@ -97,7 +97,7 @@ def profile(args):
             except KeyboardInterrupt:
                 break
 
-    print "Starting profiling for %i timesteps, use CTRL+C to quit." % args.iterations
+    print("Starting profiling for %i timesteps, use CTRL+C to quit." % args.iterations)
     cProfile.runctx('run()', globals(), locals(), args.filename, args.sort)
     return ''
 
@@ -109,7 +109,7 @@ def head2head(args):
     start = time.time()
     world = World(ally_conf_path=args.conf_path, maximum_time=args.iterations)
 
-    print "Starting headless simulation, use CTRL+C to quit."
+    print("Starting headless simulation, use CTRL+C to quit.")
     writer = csv.writer(args.stream, delimiter='\t')
     writer.writerow(('black', 'red'))
     while world.time < world.iterations:
@@ -117,9 +117,9 @@ def head2head(args):
             world.update()
             writer.writerow((str(world.ally_home.stash), str(world.enemy_home.stash)))
             if world.time % 1000 == 0:
-                print "%ik iterations completed" % (world.time / 1000)
+                print("%ik iterations completed" % (world.time // 1000))
         except KeyboardInterrupt:
-            print "Quitting Early!"
+            print("Quitting Early!")
             break
 
     finit = time.time()
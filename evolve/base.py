@@ -67,7 +67,7 @@ class Evolver(object):
         standalone, seperate method to ensure that the user must
         initialize their own population.
         """
-        for idx in xrange(popsize):
+        for idx in range(popsize):
             config = AllyParameters()
             for state in [config.spreading, config.seeking, config.caravan, config.guarding]:
                 for key, val in state.components.items():
@@ -188,7 +188,7 @@ class Evolver(object):
                         json.dump(individual, fit, indent=4)
 
                     # TODO: switch to logger
-                    print json.dumps(individual)
+                    print(json.dumps(individual))
                     sys.stdout.flush()
 
                 # Then this current generation isn't done
@@ -204,10 +204,10 @@ class Evolver(object):
         """
         self.started  = time.time()
 
-        for gen in xrange(self.start, self.maxgens):
+        for gen in range(self.start, self.maxgens):
             # Generate the current population and queue simulations
             self.curpop = []
-            for idx in xrange(self.popsize):
+            for idx in range(self.popsize):
                 conf, fit = individual_paths(gen, idx, self.confdir)
                 self.curpop.append({
                     'conf_path': conf,                  # Path to the configuration file
@@ -287,15 +287,15 @@ class Evolver(object):
         """
         # Sort the current population according to their fitness.
         parents  = sorted(parents, key=itemgetter(1), reverse=True)
-        print "Elites are: %s" % ", ".join(str(i) for c,f,i in parents[:elites])
+        print("Elites are: %s" % ", ".join(str(i) for c,f,i in parents[:elites]))
         # Start by selecting the elites as children
         children = [copy.deepcopy(c) for c,f,i in parents[:elites]]
         parents  = parents[elites:]
 
         if parents:
             # Perform as many tournaments as we have remaining population
-            for idx in xrange(elites, self.popsize):
-                tourney = [random.choice(parents) for jdx in xrange(tourney_size)]
+            for idx in range(elites, self.popsize):
+                tourney = [random.choice(parents) for jdx in range(tourney_size)]
                 tourney = sorted(tourney, key=itemgetter(1), reverse=True)
                 children.append(copy.deepcopy(tourney[0][0]))
 
@@ -326,7 +326,7 @@ class Evolver(object):
                 config['depo_guard_threshold'] = minmax(5, 0, mutation)
 
             for state in ['spreading', 'seeking', 'caravan', 'guarding']:
-                for k, v in config[state]['components'].iteritems():
+                for k, v in config[state]['components'].items():
 
                     if (random.random() < mutprob):
                         weight = round(v['weight'] - mutweight + (2.0 * random.random() * mutweight), 3)
@@ -414,6 +414,6 @@ if __name__ == '__main__':
             counts[md5(item['path'])].append(item['name'])
 
     import json
-    print json.dumps(counts, indent=4)
+    print(json.dumps(counts, indent=4))
 
     unchanged = [key for key in counts if len(counts[key]) > 1]
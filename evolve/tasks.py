@@ -36,7 +36,7 @@ def runsim(configuration):
     start = time.time()
     world = World(ally_conf_path=configuration)
 
-    for step in xrange(world.iterations):
+    for step in range(world.iterations):
         try:
             world.update()
         except Exception as e:
@@ -69,7 +69,7 @@ def head2head(configuration, outpath, iterations=10000):
         writer.writerow(header)
         writer.writerow(world.status())
 
-        for step in xrange(world.iterations):
+        for step in range(world.iterations):
             try:
                 world.update()
                 writer.writerow(world.status())
@@ -51,7 +51,7 @@ def parse_genotype(path):
     Extracts the genotype out of a configuration yaml file.
     """
     with open(path, 'r') as conf:
-        return yaml.load(conf)
+        return yaml.safe_load(conf)
 
 def export_genotype(genotype, path=None):
     """
@@ -6,6 +6,18 @@ try:
 except ImportError:
     raise ImportError("Could not import \"setuptools\". Please install the setuptools package.")
 
+try:
+    # setuptools compiles the .pyx sources itself when Cython is installed
+    import Cython
+    from setuptools import Extension
+    ext_modules = [
+        # The compiled vector kernels are optional, install without them
+        # if there is no C compiler available.
+        Extension("swarm.vectors_c", ["swarm/vectors_c.pyx"], optional=True),
+    ]
+except ImportError:
+    ext_modules = []
+
 
 packages = find_packages(where=".", exclude=('tests', 'bin', 'docs', 'fixtures', 'assets', 'conf', 'deploy'))
 
@@ -28,6 +40,7 @@ classifiers = (
     'Operating System :: MacOS :: MacOS X',
     'Operating System :: POSIX :: Linux',
     'Programming Language :: Python :: 2.7',
+    'Programming Language :: Python :: 3',
     'Topic :: Scientific/Engineering :: Artificial Life',
     'Topic :: Scientific/Engineering :: Artificial Intelligence',
 )
@@ -40,6 +53,7 @@ config = {
     "author_email": "benjamin@bengfort.com",
     "url": "https://github.com/mclumd/swarm-simulator",
     "packages": packages,
+    "ext_modules": ext_modules,
     "install_requires": requires,
     "classifiers": classifiers,
     "zip_safe": False,
@@ -17,7 +17,7 @@ An offline (non-visual) search and retrieval simulation
 ## Imports
 ##########################################################################
 
-from viz import *
-from world import *
-from particle import *
-from exceptions import *
+from .viz import *
+from .world import *
+from .particle import *
+from .exceptions import *
@@ -24,6 +24,8 @@ supported distributions currently:
 
 import numpy as np
 
+from swarm.vectors import random_sample
+
 ##########################################################################
 ## Linear helper functions
 ##########################################################################
@@ -35,7 +37,7 @@ def linear_distribute(num=50, l=100, m=1, b=0, rand=False):
     """
     xvals = np.linspace(0, l, num)
     if rand:
-        xvals = xvals * np.random.rand((num))
+        xvals = xvals * random_sample(num)
     yvals = xvals * m + b
     return xvals, yvals
 
@@ -55,7 +57,7 @@ def linear_graph(num=50, l=100, m=1, b=0):
     try:
         import pylab as plt
     except ImportError:
-        print "Must have pylab/matplotlib installed to graph"
+        print("Must have pylab/matplotlib installed to graph")
         return
 
     plt.figure(figsize=(7,6))
@@ -75,7 +77,7 @@ def circular_distribute(num=50, r=100, center=(0,0)):
     radius. Used to deploy particles around their home position.
     """
     theta = np.linspace(0, 2*np.pi, num)
-    rands = np.random.rand((num))
+    rands = random_sample(num)
     xvals = r * rands * np.cos(theta) + center[0]
     yvals = r * rands * np.sin(theta) + center[1]
     return xvals, yvals
@@ -95,7 +97,7 @@ def circular_graph(num=50, r=100, center=(0,0)):
     try:
         import pylab as plt
     except ImportError:
-        print "Must have pylab/matplotlib installed to graph"
+        print("Must have pylab/matplotlib installed to graph")
         return
 
     plt.figure(figsize=(7,6))
@@ -45,6 +45,8 @@ dictionary-like access.
 ## Imports
 ##########################################################################
 
+from __future__ import print_function
+
 import os
 import yaml
 import fileinput
@@ -104,7 +106,7 @@ class Configuration(object):
         for path in klass.CONF_PATHS:
             if os.path.exists(path):
                 with open(path, 'r') as conf:
-                    config.configure(yaml.load(conf))
+                    config.configure(yaml.safe_load(conf))
         return config
 
     @classmethod
@@ -115,21 +117,21 @@ class Configuration(object):
         """
         config = klass()
         with open(path, 'r') as conf:
-            config.configure(yaml.load(conf))
+            config.configure(yaml.safe_load(conf))
         return config
 
     def dump_file(self, path):
         """
         Dumps the YAML configuration out to a file.
         """
-        with open(path, 'wb') as out:
+        with open(path, 'w') as out:
             data = dict(self.options())
             del data['max_radius']
             yaml.dump(data, out, default_flow_style=False)
 
         # kludgy way of removing the type tags
         for line in fileinput.input(path, inplace = True):
-            print re.sub(r'!!.*$', '', line),
+            print(re.sub(r'!!.*$', '', line), end='')
 
     def configure(self, conf={}):
         """
@@ -142,7 +144,7 @@ class Configuration(object):
         if isinstance(conf, Configuration):
             conf = dict(conf.options())
 
-        keys = conf.keys()
+        keys = list(conf.keys())
         for key in keys:
             opt = self.get(key, None)
             if isinstance(opt, Configuration):
@@ -156,8 +158,7 @@ class Configuration(object):
         """
         keys = self.__class__.__dict__.copy()
         keys.update(self.__dict__)
-        keys = keys.keys()
-        keys.sort()
+        keys = sorted(keys.keys())
 
         for opt in keys:
             val = self.get(opt)
@@ -321,8 +322,8 @@ class SimulationParameters(Configuration):
             self._max_radius = None
             for behavior in behaviors:
                 for component in behavior.components.values():
+                    if component.radius is None or isinstance(component.radius, str): continue
                     if self._max_radius is None or component.radius > self._max_radius:
-                        if isinstance(component.radius, str): continue
                         self._max_radius = component.radius
         return self._max_radius
 
@@ -376,8 +377,8 @@ class AllyParameters(Configuration):
             self._max_radius = None
             for behavior in behaviors:
                 for component in behavior.components.values():
+                    if component.radius is None or isinstance(component.radius, str): continue
                     if self._max_radius is None or component.radius > self._max_radius:
-                        if isinstance(component.radius, str): continue
                         self._max_radius = component.radius
         return self._max_radius
 
@@ -389,4 +390,4 @@ world_parameters = SimulationParameters.load()
 ally_parameters = AllyParameters.load()
 
 if __name__ == '__main__':
-    print world_parameters
+    print(world_parameters)
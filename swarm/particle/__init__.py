@@ -17,4 +17,4 @@ Package that defines agents or particles that can be in the world.
 ## Imports
 ##########################################################################
 
-from base import *
+from .base import *
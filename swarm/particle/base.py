@@ -17,11 +17,13 @@ A Particle class for local behaviors
 ## Imports
 ##########################################################################
 
+from __future__ import print_function
+
 import numpy as np
 
 from swarm.params import *
 from swarm.exceptions import *
-from swarm.vectors import Vector
+from swarm.vectors import Vector, ZERO
 
 ##########################################################################
 ## Module Constants
@@ -155,7 +157,9 @@ class Particle(object):
             enemy = self.find_nearest(30, 360, team=self.enemy, except_state=STUNNED)
             if enemy:
                 self._state = STUNNED
-                angle = (enemy.pos - self.pos).angle(self.vel)
+                dx = enemy.pos[0] - self.pos[0]
+                dy = enemy.pos[1] - self.pos[1]
+                angle = self.vel.angle((dx, dy))
                 self.stun_cooldown = (180 - angle) / 1
                 return
 
@@ -179,7 +183,7 @@ class Particle(object):
                 return
 
         if self.state == SEEKING:
-            if self.pos.distance2(self.target.relative_pos(self.pos)) < 900:
+            if self.pos.within(self.target.relative_pos(self.pos), 30):
                 if self.target.stash > 0:
                     if self.target.idx != (self.enemy + '_home') and \
                             len([n for n in self.neighbors(200, 360, team=self.team) if n.state == GUARDING or n._state == GUARDING]) < self.params.depo_guard_threshold:
@@ -197,7 +201,7 @@ class Particle(object):
                     return
 
         if self.state == CARAVAN:
-            if self.pos.distance2(self.target.relative_pos(self.pos)) < 100:
+            if self.pos.within(self.target.relative_pos(self.pos), 10):
                 self.target.drop()
                 self._loaded = False
 
@@ -225,13 +229,13 @@ class Particle(object):
         Swap new pos/vel for old ones.
         """
         if world_parameters.debug:
-            print "Particle %s" % self.idx
-            print "Position: %s --> %s" % (self.pos, self._pos)
-            print "Velocity: %s --> %s" % (self.vel, self._vel)
-            print "State:    %s --> %s" % (self.state, self._state)
-            print "Target:   %s --> %s" % (self.target, self._target)
-            print "Loaded:   %s --> %s" % (self.loaded, self._loaded)
-            print
+            print("Particle %s" % self.idx)
+            print("Position: %s --> %s" % (self.pos, self._pos))
+            print("Velocity: %s --> %s" % (self.vel, self._vel))
+            print("State:    %s --> %s" % (self.state, self._state))
+            print("Target:   %s --> %s" % (self.target, self._target))
+            print("Loaded:   %s --> %s" % (self.loaded, self._loaded))
+            print()
         self.pos     = self._pos
         self.vel     = self._vel
         self.state   = self._state
@@ -279,12 +283,14 @@ class Particle(object):
         Determines whether or not another point (Vector) is in sight of the
         current particule based on a given radius and alpha.
         """
-        radius2 = radius * radius
-        delta = point - self.pos
-        if delta.length2 > radius2: return False # The distance is outside the vision radius
+        dx = point[0] - self.pos[0]
+        if dx > radius or dx < -radius: return False   # Outside the vision radius on x
+        dy = point[1] - self.pos[1]
+        if dy > radius or dy < -radius: return False   # Outside the vision radius on y
+        if dx*dx + dy*dy > radius*radius: return False  # The distance is outside the vision radius
 
-        angle = self.vel.angle(delta)
-        alpha = alpha / 2
+        angle = self.vel.angle((dx, dy))
+        alpha = alpha // 2
         if angle > alpha: return False         # The angle is outside our vision angle from heading
 
         return True
@@ -292,14 +298,23 @@ class Particle(object):
     def relative_pos(self, point):
         size_x = self.world.size[0]
         size_y = self.world.size[1]
-        rel_x = self.pos.x
-        rel_y = self.pos.y
-        if (abs(self.pos.x - point.x) > size_x / 2):
-            rel_x += (-1 if (self.pos.x - point.x) > 0 else 1) * size_x
-        if (abs(self.pos.y - point.y) > size_y/ 2):
-            rel_y += (-1 if (self.pos.y - point.y) > 0 else 1) * size_y
+        rel_x, rel_y = self.pos[0], self.pos[1]
+        dx = rel_x - point[0]
+        dy = rel_y - point[1]
+        if (abs(dx) > size_x // 2):
+            rel_x += (-1 if dx > 0 else 1) * size_x
+        if (abs(dy) > size_y // 2):
+            rel_y += (-1 if dy > 0 else 1) * size_y
         return Vector.arrp(rel_x, rel_y)
 
+    def set_neighborhood(self, agents):
+        """
+        Sets the agents within RMAX for the current timestep (e.g. when the
+        world computes every neighborhood at once) so that neighbors does
+        not have to scan the world itself. The neighborhood is reset by blit.
+        """
+        self._neighbors = list(agents)
+
     def neighbors(self, radius, alpha, team='any', source='internal'):
         """
         Finds the neighbors given a radius and an alpha
@@ -356,7 +371,7 @@ class Particle(object):
         neighbors = [n for n in self.neighbors(r,a, team=self.team) if (n.state != GUARDING and n.state != STUNNED)]
 
         if not neighbors:
-            return Vector.zero()
+            return ZERO
 
         center = np.average(list(n.relative_pos(self.pos) for n in neighbors), axis=0)
         delta  = center - self.pos
@@ -374,7 +389,7 @@ class Particle(object):
         neighbors = [x for x in list(self.neighbors(r,a, team=self.team)) if (x.state == SEEKING or x.state == SPREADING)]
 
         if not neighbors:
-            return Vector.zero()
+            return ZERO
 
         center = np.average(list(n.relative_pos(self.pos) for n in neighbors), axis=0)
         deltap = center - self.pos
@@ -416,7 +431,7 @@ class Particle(object):
         neighbors = list(self.neighbors(r,a, team=self.team))
 
         if not neighbors:
-            return Vector.zero()
+            return ZERO
 
         center = np.average(list(n.relative_pos(self.pos) for n in neighbors), axis=0)
         delta  = center - self.pos
@@ -449,10 +464,10 @@ class Particle(object):
         if neighbors:
             center = np.average(list(n.relative_pos(self.pos) for n in neighbors), axis=0)
             delta  = center - self.pos
-            if (np.cross(delta, self.vel) < 0):
+            if (delta[0]*self.vel[1] - delta[1]*self.vel[0] < 0):
                 delta *= -1
             return VMAX * delta.orthogonal
-        return Vector.zero()
+        return ZERO
 
     def homing(self):
         """
@@ -511,31 +526,33 @@ class ResourceParticle(Particle):
         self.stash += 1
         return True
 
-    def __nonzero__(self):
+    def __bool__(self):
         return self.stash > 0
 
+    __nonzero__ = __bool__
+
 if __name__ == '__main__':
 
-    from params import *
-    from world import SimulatedWorld
+    from swarm.params import *
+    from swarm.world import World
 
     debug = world_parameters.get('debug', True)
-    world = SimulatedWorld()
+    world = World()
 
     def update(iterations=1):
 
         def inner_update():
             for agent in world.agents:
                 agent.update()
-                print "%s at %s going %s" % (agent.idx, str(agent.pos), str(agent.vel))
+                print("%s at %s going %s" % (agent.idx, str(agent.pos), str(agent.vel)))
 
-        print "Initial state:"
+        print("Initial state:")
         for agent in world.agents:
-            print "%s at %s going %s" % (agent.idx, str(agent.pos), str(agent.vel))
+            print("%s at %s going %s" % (agent.idx, str(agent.pos), str(agent.vel)))
 
-        for i in xrange(1, iterations+1):
-            print
-            print "Iteration #%i" % i
+        for i in range(1, iterations+1):
+            print()
+            print("Iteration #%i" % i)
             inner_update()
 
     update()
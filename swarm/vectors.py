@@ -20,6 +20,67 @@ Vector helper methods for use in sarsim
 import math
 import numpy as np
 
+##########################################################################
+## Scalar Kernels
+##########################################################################
+
+## These are deliberately not Numba compiled: for two floats the dispatch
+## costs more than the arithmetic (see swarm.vectors_batch instead).
+
+def _length(x, y):
+    """
+    Length of the vector (x, y)
+    """
+    return math.sqrt(x*x + y*y)
+
+def _distance(x1, y1, x2, y2):
+    """
+    Euclidean distance between the points (x1, y1) and (x2, y2)
+    """
+    return math.hypot(x1 - x2, y1 - y2)
+
+def _angle(x1, y1, x2, y2):
+    """
+    Unsigned angle in radians between the vectors (x1, y1) and (x2, y2),
+    the angle to or from the zero vector is reported as a right angle.
+    """
+    cross = x1*y2 - y1*x2
+    dot   = x1*x2 + y1*y2
+    if cross == 0 and dot == 0:
+        return math.pi / 2
+    return abs(math.atan2(cross, dot))
+
+try:
+    # Use the compiled Cython kernels if the extension has been built
+    from swarm.vectors_c import _length, _distance, _angle
+except ImportError:
+    pass
+
+##########################################################################
+## Random Number Generation
+##########################################################################
+
+def random_generator(seed=None):
+    """
+    Returns a NumPy random Generator, or a RandomState on versions of
+    NumPy that predate Generators (both can produce random integers).
+    """
+    if hasattr(np.random, 'default_rng'):
+        return np.random.default_rng(seed)
+    return np.random.RandomState(seed)
+
+## Cached generator for random vectors and points (see Vector.seed)
+_rng = random_generator()
+
+def random_sample(size=None):
+    """
+    Returns uniform random floats in [0, 1) from the cached generator, so
+    that points distributed in the world are reproduced by Vector.seed.
+    """
+    if hasattr(_rng, 'random'):
+        return _rng.random(size)
+    return _rng.random_sample(size)
+
 ##########################################################################
 ## Vector Class
 ##########################################################################
@@ -65,7 +126,26 @@ class Vector(np.ndarray):
         low to high, unless high is None, then from 0 to low. The default
         shape of this vector is 2 (for 2 dimensional particle physics).
         """
-        return klass.arr(np.random.randint(low, high, size=2))
+        if hasattr(_rng, 'integers'):
+            return klass.arr(_rng.integers(low, high, size=2))
+        return klass.arr(_rng.randint(low, high, size=2))
+
+    @classmethod
+    def seed(klass, seed=None):
+        """
+        Reseeds the generator used by rand and random_sample (and so by
+        swarm.distribute), e.g. for reproducible runs.
+        """
+        global _rng
+        _rng = random_generator(seed)
+
+    def __array_finalize__(self, obj):
+        """
+        Reset the cached computations on every new vector (or view)
+        """
+        self._length     = None
+        self._unit       = None
+        self._orthogonal = None
 
     ##////////////////////////////////////////////////////////////////////
     ## Vector computation on the array
@@ -84,11 +164,13 @@ class Vector(np.ndarray):
         """
         Returns the unit vector (length 1) of this vector
         """
-        if not hasattr(self, '_unit'):
-            if self.length > 0:
-                self._unit = self / self.length
+        if self._unit is None:
+            length = self.length
+            if length > 0:
+                inv = 1.0 / length
+                self._unit = self.arrp(self[0]*inv, self[1]*inv)
             else:
-                self._unit = np.zeros_like(self)
+                self._unit = ZERO
         return self._unit
 
     @property
@@ -96,8 +178,8 @@ class Vector(np.ndarray):
         """
         Compute the length of the vector
         """
-        if not hasattr(self, '_length'):
-            self._length = math.sqrt(self.length2)
+        if self._length is None:
+            self._length = _length(self[0], self[1])
 
         return self._length
 
@@ -106,50 +188,82 @@ class Vector(np.ndarray):
         """
         Compute the squared length of the vector
         """
-        return self.x*self.x + self.y*self.y
+        return self[0]*self[0] + self[1]*self[1]
 
     @property
     def orthogonal(self):
         """
         Returns the unit vector orthogonal in the +z direction
         """
-        if not hasattr(self, '_orthogonal'):
-            u = self.unit
-            b = np.empty_like(u)
-            b[0] = -u[1]
-            b[1] = u[0]
-            self._orthogonal = self.arr(b)
+        if self._orthogonal is None:
+            length = self.length
+            if length > 0:
+                inv = 1.0 / length
+                self._orthogonal = self.arrp(-self[1]*inv, self[0]*inv)
+            else:
+                self._orthogonal = ZERO
         return self._orthogonal
 
+    def orthogonal_into(self, out):
+        """
+        Writes the unit vector orthogonal in the +z direction into out (a
+        caller owned, writeable buffer) rather than allocating a new one.
+        """
+        length = self.length
+        if length > 0:
+            inv = 1.0 / length
+            out[0] = -self[1]*inv
+            out[1] = self[0]*inv
+        else:
+            out[0] = out[1] = 0.0
+        return out
+
     def angle(self, other, degrees=True):
         """
         Compute the angle between two vectors
         If degrees is true return degrees else radians
-        """
 
-        def angle_radians(self, other):
-            angle = np.arccos(np.dot(self.unit, other.unit))
-            if np.isnan(angle):
-                if (self.unit==other.unit).all():
-                    return 0.0
-                return np.pi
-            return angle
+        The angle is computed from the cross and dot products so that
+        neither vector needs to be normalized. The angle to or from the
+        zero vector is reported as a right angle.
+        """
+        angle = _angle(self[0], self[1], other[0], other[1])
+        if degrees: return math.degrees(angle)
+        return angle
 
-        angle = angle_radians(self, other)
-        if degrees: return np.degrees(angle)
+    def heading(self, degrees=True):
+        """
+        Compute the (signed) direction of the vector counter clockwise
+        from the +x axis. If degrees is true return degrees else radians
+        """
+        angle = math.atan2(self[1], self[0])
+        if degrees: return math.degrees(angle)
         return angle
 
     def distance(self, other):
         """
         Compute the Euclidean distance between two vectors
         """
-        return np.linalg.norm(self-other)
+        return _distance(self[0], self[1], other[0], other[1])
 
     def distance2(self, other):
         """
         Compute the squared Euclidean distance between two vectors
         """
-        return (self.x-other.x)**2 + (self.y-other.y)**2
+        dx = self[0] - other[0]
+        dy = self[1] - other[1]
+        return dx*dx + dy*dy
+
+    def within(self, other, radius):
+        """
+        Is the other vector strictly within radius of this one? Compares
+        squared distances, and rejects on either axis before multiplying.
+        """
+        dx = self[0] - other[0]
+        if dx > radius or dx < -radius: return False
+        dy = self[1] - other[1]
+        if dy > radius or dy < -radius: return False
+        return dx*dx + dy*dy < radius*radius
 
     def copy(self):
         """
@@ -159,15 +273,28 @@ class Vector(np.ndarray):
 
     def __eq__(self, other):
         """
-        Are two vectors equal?
+        Are two vectors equal? Uses the same tolerance as np.allclose
+        (rtol=1e-05, atol=1e-08) but compares the two components directly.
         """
-        return np.allclose(self, other)
+        ox, oy = other[0], other[1]
+        return abs(self[0] - ox) <= 1e-08 + 1e-05 * abs(ox) and \
+               abs(self[1] - oy) <= 1e-08 + 1e-05 * abs(oy)
 
     def __ne__(self, other):
         return not self == other
 
+    # Vectors compare with a tolerance so equal vectors cannot hash alike
+    __hash__ = None
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+## Shared (readonly) zero vector, to avoid allocating one on every use
+ZERO = Vector.zero()
+
 if __name__ == '__main__':
     v1 = Vector.arr(np.array([2,4]))
     v2 = Vector.arr(np.array([0,1]))
 
-    print v1.angle(v2)
+    print(v1.angle(v2))
@@ -0,0 +1,172 @@
+# swarm.vectors_batch
+# Batched vector computations over an entire population of particles
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Thu Oct 15 09:12:40 2026 -0400
+#
+# Copyright (C) 2014 Bengfort.com
+# For license information, see LICENSE.txt
+#
+# ID: vectors_batch.py [] benjamin@bengfort.com $
+
+"""
+Batched vector computations over an entire population of particles.
+
+Where the Vector class operates on a single 2 dimensional vector, these
+helpers operate on an (N, 2) array of vectors (one row per particle) so
+that the world can compute its neighborhoods once per tick rather than
+dispatching a Vector method for every pair of particles.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange    = range
+
+    def njit(*args, **kwargs):
+        """
+        Without Numba the kernels are simply run as Python functions.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    HAS_SIMSIMD = False
+
+## Set to False to use the NumPy kernels even if SimSIMD is installed
+USE_SIMSIMD = HAS_SIMSIMD
+
+##########################################################################
+## Batched Vector Computations
+##########################################################################
+
+def lengths(P):
+    """
+    Compute the length of every vector (row) in P
+    """
+    return np.sqrt(np.einsum('ij,ij->i', P, P))
+
+def units(P):
+    """
+    Compute the unit vector of every vector (row) in P, zero vectors are
+    returned as zero vectors rather than dividing by zero.
+    """
+    P = np.asarray(P, dtype=float)
+    L = lengths(P)[:, None]
+    U = np.zeros_like(P)
+    np.divide(P, L, out=U, where=L > 0)
+    return U
+
+def orthogonals(U):
+    """
+    Compute the vector orthogonal in the +z direction to every vector in U.
+    Pass the result of units to get the unit orthogonal vectors.
+    """
+    return np.column_stack((-U[:, 1], U[:, 0]))
+
+@njit(parallel=True, cache=True)
+def _distances_to(points, rx, ry):
+    """
+    Numba kernel for distances_to (only used when Numba is installed)
+    """
+    out = np.empty(points.shape[0])
+    for idx in prange(points.shape[0]):
+        dx = points[idx, 0] - rx
+        dy = points[idx, 1] - ry
+        out[idx] = math.sqrt(dx*dx + dy*dy)
+    return out
+
+def distances_to(points, ref):
+    """
+    Compute the Euclidean distance from every row in points to ref
+    """
+    points = np.asarray(points, dtype=float)
+    if HAS_NUMBA:
+        return _distances_to(points, float(ref[0]), float(ref[1]))
+    return lengths(points - np.asarray(ref, dtype=float))
+
+def sqnorms(P):
+    """
+    Compute the squared length of every vector (row) in P
+    """
+    P = np.asarray(P, dtype=float)
+    return np.einsum('ij,ij->i', P, P)
+
+def pairwise_sqdist(X, Y=None, Ynorms=None):
+    """
+    Compute the squared Euclidean distance between every row in X and
+    every row in Y (or X if Y is None) using the ||x||^2 + ||y||^2 - 2xy
+    expansion, so that the bulk of the work is a single matrix product.
+
+    When querying repeatedly against the same Y, pass its precomputed
+    sqnorms as Ynorms so they are not recomputed on every call.
+
+    If SimSIMD is installed (and USE_SIMSIMD is set) its batched kernels
+    are used instead and Ynorms is ignored.
+    """
+    if USE_SIMSIMD:
+        X = np.ascontiguousarray(X, dtype=float)
+        Y = X if Y is None else np.ascontiguousarray(Y, dtype=float)
+        return np.asarray(simsimd.cdist(X, Y, metric="sqeuclidean"))
+
+    X = np.asarray(X, dtype=float)
+    Xnorms = sqnorms(X)
+
+    if Y is None:
+        Y = X
+        if Ynorms is None: Ynorms = Xnorms
+    else:
+        Y = np.asarray(Y, dtype=float)
+
+    if Ynorms is None:
+        Ynorms = sqnorms(Y)
+
+    D = np.dot(X, Y.T)
+    D *= -2.0
+    D += Xnorms[:, None]
+    D += Ynorms[None, :]
+    np.maximum(D, 0, out=D)
+    return D
+
+def pairwise_distances(X, Y=None, Ynorms=None):
+    """
+    Compute the Euclidean distance between every row in X and every row
+    in Y (or X if Y is None), see pairwise_sqdist.
+    """
+    return np.sqrt(pairwise_sqdist(X, Y, Ynorms))
+
+def periodic_deltas(P, size):
+    """
+    Compute the delta from every position in P to every other position in
+    a periodic world of the given size, such that D[i,j] is the vector
+    from P[i] to the nearest periodic image of P[j]. This is the batched
+    equivalent of `Particle.relative_pos(point) - point`.
+    """
+    P    = np.asarray(P, dtype=float)
+    size = np.asarray(size, dtype=float)
+    half = size // 2
+
+    D = P[None, :, :] - P[:, None, :]
+    D -= size * (D > half) - size * (D < -half)
+    return D
+
+def periodic_sqdist(P, size):
+    """
+    Compute the squared distance between every pair of positions in P in a
+    periodic world of the given size.
+    """
+    D = periodic_deltas(P, size)
+    return np.einsum('ijk,ijk->ij', D, D)
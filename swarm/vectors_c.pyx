@@ -0,0 +1,65 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+# swarm.vectors_c
+# Compiled scalar kernels for the Vector helper methods
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Thu Oct 15 11:02:51 2026 -0400
+#
+# Copyright (C) 2014 Bengfort.com
+# For license information, see LICENSE.txt
+#
+# ID: vectors_c.pyx [] benjamin@bengfort.com $
+
+"""
+Compiled scalar kernels for the Vector helper methods. These are used by
+swarm.vectors in place of the Python kernels when this extension has been
+built (python setup.py build_ext --inplace).
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from libc.math cimport sqrt, atan2, fabs, M_PI
+
+##########################################################################
+## C Kernels
+##########################################################################
+
+cdef inline double _length_c(double x, double y) nogil:
+    return sqrt(x*x + y*y)
+
+cdef inline double _distance_c(double x1, double y1, double x2, double y2) nogil:
+    cdef double dx = x1 - x2
+    cdef double dy = y1 - y2
+    return sqrt(dx*dx + dy*dy)
+
+cdef inline double _angle_c(double x1, double y1, double x2, double y2) nogil:
+    cdef double cross = x1*y2 - y1*x2
+    cdef double dot   = x1*x2 + y1*y2
+    if cross == 0 and dot == 0:
+        return M_PI / 2
+    return fabs(atan2(cross, dot))
+
+##########################################################################
+## Python Wrappers
+##########################################################################
+
+def _length(double x, double y):
+    """
+    Length of the vector (x, y)
+    """
+    return _length_c(x, y)
+
+def _distance(double x1, double y1, double x2, double y2):
+    """
+    Euclidean distance between the points (x1, y1) and (x2, y2)
+    """
+    return _distance_c(x1, y1, x2, y2)
+
+def _angle(double x1, double y1, double x2, double y2):
+    """
+    Unsigned angle in radians between the vectors (x1, y1) and (x2, y2),
+    the angle to or from the zero vector is reported as a right angle.
+    """
+    return _angle_c(x1, y1, x2, y2)
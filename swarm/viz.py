@@ -6,7 +6,7 @@ import numpy
 try:
     import pygame
 except ImportError:
-    print "Warning: PyGame required for visual simulations."
+    print("Warning: PyGame required for visual simulations.")
 
 def visualize(world, screen_size, fps):
     pygame.init()
@@ -62,7 +62,7 @@ def draw(screen, world, ally_0, ally_1, enemy_0, enemy_1, scale, mine_0, mine_1,
     screen.fill(0xffffffff)
 
     for agent in world.agents:
-        angle = math.atan2(agent.vel[1], agent.vel[0])
+        angle = agent.vel.heading(degrees=False)
 
         # HACK! Kevin- go ahead and fix this!
         if agent.__class__.__name__ == "ResourceParticle":
@@ -86,8 +86,8 @@ def draw(screen, world, ally_0, ally_1, enemy_0, enemy_1, scale, mine_0, mine_1,
                 image = rotation(enemy_0, angle)
         # HACK OVER!
 
-        x = agent.pos[0] * scale[0] - image.get_width() / 2
-        y = screen.get_height() - (agent.pos[1] * scale[1] + image.get_height() / 2)
+        x = agent.pos[0] * scale[0] - image.get_width() // 2
+        y = screen.get_height() - (agent.pos[1] * scale[1] + image.get_height() // 2)
         screen.blit(image, (x, y))
 
     pygame.display.flip()
@@ -96,7 +96,7 @@ def bake_rotations(image, scale, a0, steps):
     baked = []
     step_size = 2 * math.pi / steps
 
-    for step in xrange(steps):
+    for step in range(steps):
         a = step * step_size - a0
         degrees = a * 180.0 / math.pi
         baked.append(pygame.transform.rotozoom(image, degrees, scale))
@@ -17,10 +17,13 @@ Contains the mechanics and behavior of the world
 ## Imports
 ##########################################################################
 
-from particle import *
-from vectors import Vector
-from params import *
-from distribute import circular_distribute, linear_distribute
+import numpy as np
+
+from .particle import *
+from .vectors import Vector
+from .vectors_batch import periodic_sqdist
+from .params import *
+from .distribute import circular_distribute, linear_distribute
 
 ##########################################################################
 ## Helper functions
@@ -136,7 +139,25 @@ class World(object):
         for agent in agents:
             self.add_agent(agent)
 
+    def update_neighborhoods(self):
+        """
+        Computes the distance between every pair of agents once per tick
+        and hands each agent its neighborhood within its maximum radius,
+        so that agents do not have to scan the entire world themselves.
+        """
+        if not self.agents: return
+
+        positions = np.array([agent.pos for agent in self.agents])
+        distances = periodic_sqdist(positions, self.size)
+
+        for idx, agent in enumerate(self.agents):
+            if isinstance(agent, ResourceParticle): continue  # Resources don't update
+            radius = agent.params.max_radius
+            within = np.flatnonzero(distances[idx] <= radius * radius)
+            agent.set_neighborhood(self.agents[jdx] for jdx in within if jdx != idx)
+
     def update(self):
+        self.update_neighborhoods()
         for agent in self.agents:
             agent.update()
         for agent in self.agents:
@@ -46,7 +46,7 @@ class EvolverTest(unittest.TestCase):
 
     def setUp(self):
         self.confdir = tempfile.mkdtemp('evolution')
-        print self.confdir
+        print(self.confdir)
 
     def tearDown(self):
         shutil.rmtree(self.confdir)
@@ -84,7 +84,7 @@ class EvolverTest(unittest.TestCase):
                 counts[md5(item['path'])].append(item['name'])
 
         import json
-        print json.dumps(counts, indent=4)
+        print(json.dumps(counts, indent=4))
 
         unchanged = [key for key in counts if len(counts[key]) > 1]
         self.assertEqual(len(unchanged), ELITES)
@@ -105,8 +105,11 @@ class ParticleTests(unittest.TestCase):
     def test_90_view(self):
         """
         Assert A can only see in front 90
+
+        Note that E and G lie exactly on the edge of the vision cone
+        (45 degrees from the heading) and so are seen like I is in 180.
         """
-        expected = {'c'}
+        expected = {'c', 'e', 'g'}
         observed = set([])
         for neighbor in self.particle.neighbors(300,90):
             observed.add(neighbor.idx)
@@ -128,3 +131,17 @@ class ParticleTests(unittest.TestCase):
         """
         expected = self.world.agents[10]
         self.assertEqual(self.particle.find_nearest(300,360), expected)
+
+    def test_world_neighborhoods(self):
+        """
+        Check the world neighborhoods match the particle world scan
+        """
+        world = World(world_size=1000)
+        world.update_neighborhoods()
+
+        for agent in world.agents:
+            if isinstance(agent, ResourceParticle):
+                self.assertIsNone(agent._neighbors)
+                continue
+            expected = list(agent.neighbors(agent.params.max_radius, 360, source='world'))
+            self.assertEqual(expected, agent._neighbors)
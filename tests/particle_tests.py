@@ -24,7 +24,7 @@ from swarm.particle import *
 from swarm.world import World
 from swarm.vectors import Vector
 from swarm.params import world_parameters as parameters
-from world_tests import NUM_BASES
+from tests.world_tests import NUM_BASES
 
 ##########################################################################
 ## Particle Test Cases
@@ -257,7 +257,7 @@ class ResourceParticleTests(unittest.TestCase):
         mineral = ResourceParticle(Vector.arrp(15,15))
         self.assertEqual(mineral.stash, stash)
 
-        for i in xrange(0, stash):
+        for i in range(0, stash):
             self.assertTrue(mineral.mine())
 
         self.assertFalse(mineral.mine())
@@ -0,0 +1,129 @@
+# tests.vectors_batch_tests
+# Tests for the batched vector computations
+#
+# Author:   Benjamin Bengfort <benjamin@bengfort.com>
+# Created:  Thu Oct 15 09:40:12 2026 -0400
+#
+# Copyright (C) 2014 Bengfort.com
+# For license information, see LICENSE.txt
+#
+# ID: vectors_batch_tests.py [] benjamin@bengfort.com $
+
+"""
+Tests for the batched vector computations
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import unittest
+import numpy as np
+
+import swarm.vectors_batch as vectors_batch
+
+from swarm.vectors import Vector
+from swarm.vectors_batch import *
+
+##########################################################################
+## Batched Vectors Test Case
+##########################################################################
+
+class VectorsBatchTests(unittest.TestCase):
+
+    USE_SIMSIMD = False
+
+    def setUp(self):
+        self._use_simsimd = vectors_batch.USE_SIMSIMD
+        vectors_batch.USE_SIMSIMD = self.USE_SIMSIMD
+
+        self.points = np.array([
+            [0, 10], [10, 0], [10, 10], [0, 0], [-10, -10], [23, 7],
+        ])
+        self.vectors = [Vector.arr(point) for point in self.points]
+
+    def tearDown(self):
+        vectors_batch.USE_SIMSIMD = self._use_simsimd
+
+    def test_lengths(self):
+        """
+        Test batched lengths match the vector lengths
+        """
+        expected = [vec.length for vec in self.vectors]
+        self.assertTrue(np.allclose(expected, lengths(self.points)))
+
+    def test_units(self):
+        """
+        Test batched units match the vector units (including zero)
+        """
+        observed = units(self.points)
+        for vec, unit in zip(self.vectors, observed):
+            self.assertEqual(vec.unit, unit)
+
+    def test_orthogonals(self):
+        """
+        Test batched orthogonals match the vector orthogonals
+        """
+        observed = orthogonals(units(self.points))
+        for vec, orth in zip(self.vectors, observed):
+            self.assertEqual(vec.orthogonal, orth)
+
+    def test_pairwise_sqdist(self):
+        """
+        Test the pairwise squared distance matrix
+        """
+        observed = pairwise_sqdist(self.points, self.points)
+        self.assertEqual(observed.shape, (6, 6))
+        for idx, a in enumerate(self.vectors):
+            for jdx, b in enumerate(self.vectors):
+                self.assertAlmostEqual(observed[idx, jdx], a.distance2(b))
+
+    def test_periodic_sqdist(self):
+        """
+        Test that the periodic distances wrap around the world boundaries
+        """
+        points = np.array([[10, 10], [10, 990], [990, 10], [990, 990], [500, 500]])
+        observed = periodic_sqdist(points, (1000, 1000))
+
+        self.assertEqual(observed[0, 1], 400)
+        self.assertEqual(observed[0, 2], 400)
+        self.assertEqual(observed[0, 3], 800)
+        self.assertEqual(observed[0, 4], 490**2 * 2)
+        self.assertTrue(np.allclose(observed, observed.T))
+
+    def test_distances_to(self):
+        """
+        Test the one to many distances match the vector distances
+        """
+        ref = self.vectors[5]
+        expected = [vec.distance(ref) for vec in self.vectors]
+        observed = distances_to(self.points, ref)
+        self.assertTrue(np.allclose(expected, observed))
+
+    def test_pairwise_distances(self):
+        """
+        Test the pairwise distance matrix of a single set of points
+        """
+        observed = pairwise_distances(self.points)
+        self.assertEqual(observed.shape, (6, 6))
+        self.assertTrue(np.allclose(np.diag(observed), 0))
+        for idx, a in enumerate(self.vectors):
+            for jdx, b in enumerate(self.vectors):
+                self.assertAlmostEqual(observed[idx, jdx], a.distance(b))
+
+    def test_pairwise_sqdist_norms(self):
+        """
+        Test pairwise squared distances with precomputed norms
+        """
+        queries  = np.array([[1, 2], [-4, 8]])
+        expected = pairwise_sqdist(queries, self.points)
+        observed = pairwise_sqdist(queries, self.points, sqnorms(self.points))
+        self.assertTrue(np.allclose(expected, observed))
+
+@unittest.skipUnless(HAS_SIMSIMD, "SimSIMD is not installed")
+class SimSIMDVectorsBatchTests(VectorsBatchTests):
+    """
+    Runs the batched vector tests against the SimSIMD kernels
+    """
+
+    USE_SIMSIMD = True
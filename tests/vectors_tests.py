@@ -222,3 +222,89 @@ class VectorsTests(unittest.TestCase):
         B = A.copy()
         self.assertIsNot(A,B)
         self.assertEqual(A,B)
+
+    def test_cache_not_shared(self):
+        """
+        Check that derived vectors do not share cached computations
+        """
+        A = Vector.arrp(3, 4)
+        self.assertEqual(A.length, 5.0)
+        self.assertEqual(A.unit, Vector.arrp(0.6, 0.8))
+
+        B = A * 2
+        self.assertEqual(B.length, 10.0)
+        self.assertEqual(B.orthogonal, Vector.arrp(-0.8, 0.6))
+        self.assertEqual(A.length, 5.0)
+
+    def test_orthogonal_into(self):
+        """
+        Test writing the orthogonal vector into a buffer
+        """
+        out = np.zeros(2)
+        res = Vector.arrp(10, 10).orthogonal_into(out)
+        self.assertIs(res, out)
+        self.assertEqual(Vector.arrp(-0.70710678, 0.70710678), out)
+
+    def test_zero_unit(self):
+        """
+        Check the unit of the zero vector is the readonly zero vector
+        """
+        unit = Vector.zero().unit
+        self.assertEqual(unit, Vector.zero())
+        self.assertArrayNotWritable(unit)
+
+    def test_unhashable(self):
+        """
+        Check that vectors cannot be hashed
+        """
+        with self.assertRaises(TypeError):
+            set([Vector.arrp(1, 2)])
+
+    def test_within(self):
+        """
+        Test the short circuit within radius check
+        """
+        A = Vector.arrp(23, 7)
+        self.assertTrue(A.within(Vector.arrp(27, 10), 5.1))
+        self.assertFalse(A.within(Vector.arrp(27, 10), 5))
+        self.assertFalse(A.within(Vector.arrp(23, 100), 50))
+        self.assertFalse(A.within(Vector.arrp(-30, 7), 50))
+        self.assertFalse(A.within(Vector.arrp(50, 50), 50))
+
+    def test_rand_seed(self):
+        """
+        Check that seeding makes random vectors reproducible
+        """
+        Vector.seed(42)
+        A = [Vector.rand(100) for _ in range(5)]
+        Vector.seed(42)
+        B = [Vector.rand(100) for _ in range(5)]
+        Vector.seed()
+
+        for a, b in zip(A, B):
+            self.assertEqual(a, b)
+
+    def test_heading(self):
+        """
+        Test computation of the heading from the +x axis
+        """
+        cases = (
+            (Vector.arrp(10, 0), 0.0),
+            (Vector.arrp(0, 10), 90.0),
+            (Vector.arrp(10, 10), 45.0),
+            (Vector.arrp(-10, 0), 180.0),
+            (Vector.arrp(-10, -10), -135.0),
+            (Vector.arrp(0, -10), -90.0),
+        )
+
+        for case, expected in cases:
+            self.assertAlmostEqual(case.heading(), expected, places=4)
+            self.assertAlmostEqual(case.heading(False), math.radians(expected), places=4)
+
+    def test_heading_signed_zero(self):
+        """
+        Check the heading respects the sign of a zero y component
+        """
+        self.assertEqual(Vector.arrp(-1, 0.0).heading(), 180.0)
+        self.assertEqual(Vector.arrp(-1, -0.0).heading(), -180.0)
+        self.assertEqual(Vector.arrp(-1, 0.0).heading(), 180.0)
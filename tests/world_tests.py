@@ -20,6 +20,7 @@ Integration testing for the simulated world
 import unittest
 
 from swarm.world import *
+from swarm.vectors import Vector
 from swarm.params import world_parameters as parameters
 
 ##########################################################################
@@ -67,3 +68,18 @@ class WorldTests(unittest.TestCase):
         self.assertEqual(world.time, 0)
 
         old_state = []
+
+    def test_seeded_world(self):
+        """
+        Check that two worlds built after the same seed are identical
+        """
+        Vector.seed(42)
+        first  = World()
+        Vector.seed(42)
+        second = World()
+        Vector.seed()
+
+        self.assertEqual(len(first.agents), len(second.agents))
+        for a, b in zip(first.agents, second.agents):
+            self.assertEqual(a.pos, b.pos)
+            self.assertEqual(a.vel, b.vel)